@@ -75,6 +75,8 @@ async function main(): Promise<void> {
       console.log(chalk.gray('  AMICOMPAT_DEFAULT_TARGET=widely'));
       console.log(chalk.gray('  AMICOMPAT_MAX_FILES=10000'));
       console.log(chalk.gray('  AMICOMPAT_MAX_CONCURRENCY=5'));
+      console.log(chalk.gray('  AMICOMPAT_CACHE_MAX=4096'));
+      console.log(chalk.gray('  AMICOMPAT_DEBUG=1 (verbose detector logs)'));
     });
     
   program
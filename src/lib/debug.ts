@@ -0,0 +1,16 @@
+// Verbose tracing, off unless AMICOMPAT_DEBUG is set to something other
+// than an empty string, 0 or false
+const debugSetting = process.env.AMICOMPAT_DEBUG?.trim().toLowerCase();
+
+export const DEBUG = debugSetting !== undefined
+  && !['', '0', 'false'].includes(debugSetting);
+
+/**
+ * Trace output goes to stderr: in server mode stdout carries the MCP stdio
+ * transport, and anything else written there corrupts the protocol stream
+ */
+export function debugLog(...args: unknown[]): void {
+  if (DEBUG) {
+    console.error(...args);
+  }
+}
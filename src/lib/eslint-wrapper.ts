@@ -1,36 +1,162 @@
-import { ESLint } from 'eslint';
-import { computeBaseline } from 'compute-baseline';
+import type { ESLint } from 'eslint';
 import { ParseContext, IdentifiedFeature, DetailedSupport, BrowserSupport } from '../types/index.js';
+import { debugLog } from './debug.js';
+
+// use-baseline messages, one alternative per reported construct so each
+// message is scanned once; earlier alternatives win at the same position
+const CSS_MESSAGE_PATTERN = new RegExp([
+  /Property '(?<property>[^']+)'/.source,
+  /At-rule '@(?<atRule>[^']+)'/.source,
+  /Selector '(?<selector>[^']+)'/.source,
+  /Value '(?<value>[^']+)' of property '(?<valueProperty>[^']+)'/.source,
+  /Type '(?<type>[^']+)'/.source,
+].join('|'));
+
+const HTML_MESSAGE_PATTERN = new RegExp([
+  /Attribute 'type="(?<inputType>[^"]+)"' on '<input>'/.source,
+  /Element '<(?<element>[^>]+)>'/.source,
+  /Attribute '(?<attribute>[^']+)'/.source,
+].join('|'));
+
+const FEATURE_ID_UNSAFE_CHARS = /[^a-zA-Z0-9]/g;
+const FUNCTION_PARENS_SUFFIX = /\(\)$/;
+
+interface MessageFeature {
+  syntaxPattern: string;
+  featureName: string;
+  bcdKey: string;
+}
+
+type MessageFeatureBuilder = (
+  name: string,
+  groups: Record<string, string | undefined>
+) => MessageFeature;
+
+// Keyed by the first named group of each pattern alternative, so the matched
+// alternative is found with one lookup
+const CSS_MESSAGE_FEATURES: Record<string, MessageFeatureBuilder> = {
+  property: (name) => ({
+    syntaxPattern: name,
+    featureName: `CSS ${name} property`,
+    bcdKey: `css.properties.${name}`,
+  }),
+  atRule: (name) => ({
+    syntaxPattern: `@${name}`,
+    featureName: `CSS @${name} at-rule`,
+    bcdKey: `css.at-rules.${name}`,
+  }),
+  selector: (name) => ({
+    syntaxPattern: name,
+    featureName: `CSS ${name} selector`,
+    bcdKey: `css.selectors.${name}`,
+  }),
+  value: (name, groups) => ({
+    syntaxPattern: name,
+    featureName: `CSS ${name} value`,
+    bcdKey: `css.properties.${groups.valueProperty}`,
+  }),
+  type: (name) => ({
+    syntaxPattern: name,
+    featureName: `CSS ${name} function`,
+    bcdKey: `css.types.${name.replace(FUNCTION_PARENS_SUFFIX, '')}`,
+  }),
+};
+
+const HTML_MESSAGE_FEATURES: Record<string, MessageFeatureBuilder> = {
+  inputType: (name) => ({
+    syntaxPattern: `type=${name}`,
+    featureName: `HTML type="${name}" attribute`,
+    bcdKey: `html.elements.input.type_${name}`,
+  }),
+  element: (name) => ({
+    syntaxPattern: name,
+    featureName: `HTML <${name}> element`,
+    bcdKey: `html.elements.${name}`,
+  }),
+  attribute: (name) => ({
+    syntaxPattern: `${name}=`,
+    featureName: `HTML ${name} attribute`,
+    bcdKey: `html.global_attributes.${name}`,
+  }),
+};
+
+// compute-baseline results by BCD key, shared by all detectors and kept in
+// least-recently-used order so long-running servers stay bounded
+const configuredCacheMax = Number(process.env.AMICOMPAT_CACHE_MAX);
+const BASELINE_CACHE_MAX = Number.isFinite(configuredCacheMax) && configuredCacheMax !== 0
+  ? Math.max(1, Math.floor(configuredCacheMax))
+  : 4096;
+const baselineSupportCache = new Map<string, DetailedSupport | undefined>();
+
+const PROJECT_ROOT = new URL('../../..', import.meta.url).pathname;
+
+type ComputeBaseline = typeof import('compute-baseline').computeBaseline;
+
+// ESLint, its plugins and compute-baseline are imported on first use rather
+// than at startup, then resolve once per process and are shared by all
+// detectors; a server that is never asked to audit never loads them
+let eslintLoad: Promise<typeof ESLint> | undefined;
+let computeBaselineLoad: Promise<ComputeBaseline> | undefined;
+let cssPluginLoad: Promise<any> | undefined;
+let htmlPluginsLoad: Promise<[any, any]> | undefined;
+
+function loadESLint(): Promise<typeof ESLint> {
+  eslintLoad ??= import('eslint').then((m) => m.ESLint);
+  return eslintLoad;
+}
+
+function loadComputeBaseline(): Promise<ComputeBaseline> {
+  computeBaselineLoad ??= import('compute-baseline').then((m) => m.computeBaseline);
+  return computeBaselineLoad;
+}
+
+function loadCssPlugin(): Promise<any> {
+  cssPluginLoad ??= import('@eslint/css').then((m: any) => m.default || m);
+  return cssPluginLoad;
+}
+
+function loadHtmlPlugins(): Promise<[any, any]> {
+  htmlPluginsLoad ??= Promise.all([
+    import('@html-eslint/parser').then((m: any) => m.default || m),
+    import('@html-eslint/eslint-plugin').then((m: any) => m.default || m),
+  ]);
+  return htmlPluginsLoad;
+}
 
 export class ESLintFeatureDetector {
   private cssEslint?: ESLint;
   private htmlEslint?: ESLint;
+  private computeBaseline?: ComputeBaseline;
   private target: 'widely' | 'newly';
-  private initialized = false;
+  private initialization?: Promise<void>;
+  private linesByContext = new WeakMap<ParseContext, string[]>();
 
   constructor(target: 'widely' | 'newly' = 'widely') {
     this.target = target;
-    console.log(`[ESLintFeatureDetector] Created with target: ${target}`);
+    debugLog(`[ESLintFeatureDetector] Created with target: ${target}`);
   }
 
-  private async initialize() {
-    if (this.initialized) {
-      console.log(`[ESLintFeatureDetector] Already initialized, skipping...`);
-      return;
-    }
+  /**
+   * Create the linters once; concurrent callers share the same pending setup
+   */
+  private initialize(): Promise<void> {
+    this.initialization ??= this.createLinters();
+    return this.initialization;
+  }
 
-    console.log(`[ESLintFeatureDetector] Starting initialization...`);
+  private async createLinters(): Promise<void> {
+    debugLog(`[ESLintFeatureDetector] Starting initialization...`);
 
     try {
-      const cssPlugin = await import('@eslint/css').then((m: any) => m.default || m);
-      const projectRoot = new URL('../../..', import.meta.url).pathname;
+      const ESLintClass = await loadESLint();
+      const cssPlugin = await loadCssPlugin();
       
-      console.log(`[ESLintFeatureDetector] CSS Plugin loaded:`, !!cssPlugin);
-      console.log(`[ESLintFeatureDetector] Project root: ${projectRoot}`);
+      debugLog(`[ESLintFeatureDetector] CSS Plugin loaded:`, !!cssPlugin);
+      debugLog(`[ESLintFeatureDetector] Project root: ${PROJECT_ROOT}`);
 
-      this.cssEslint = new ESLint({
+      this.cssEslint = new ESLintClass({
         overrideConfigFile: true,
-        cwd: projectRoot,
+        cwd: PROJECT_ROOT,
         ignore: false,
         baseConfig: [
           {
@@ -46,22 +172,21 @@ export class ESLintFeatureDetector {
         ]
       });
       
-      console.log(`[ESLintFeatureDetector] CSS ESLint initialized successfully`);
+      debugLog(`[ESLintFeatureDetector] CSS ESLint initialized successfully`);
     } catch (error) {
       console.error('[ESLintFeatureDetector] Failed to initialize CSS ESLint:', error);
     }
 
     try {
-      const htmlParser = await import('@html-eslint/parser').then((m: any) => m.default || m);
-      const htmlPlugin = await import('@html-eslint/eslint-plugin').then((m: any) => m.default || m);
-      const projectRoot = new URL('../../..', import.meta.url).pathname;
+      const ESLintClass = await loadESLint();
+      const [htmlParser, htmlPlugin] = await loadHtmlPlugins();
       
-      console.log(`[ESLintFeatureDetector] HTML Parser loaded:`, !!htmlParser);
-      console.log(`[ESLintFeatureDetector] HTML Plugin loaded:`, !!htmlPlugin);
+      debugLog(`[ESLintFeatureDetector] HTML Parser loaded:`, !!htmlParser);
+      debugLog(`[ESLintFeatureDetector] HTML Plugin loaded:`, !!htmlPlugin);
 
-      this.htmlEslint = new ESLint({
+      this.htmlEslint = new ESLintClass({
         overrideConfigFile: true,
-        cwd: projectRoot,
+        cwd: PROJECT_ROOT,
         ignore: false,
         baseConfig: [
           {
@@ -79,20 +204,25 @@ export class ESLintFeatureDetector {
         ]
       });
       
-      console.log(`[ESLintFeatureDetector] HTML ESLint initialized successfully`);
+      debugLog(`[ESLintFeatureDetector] HTML ESLint initialized successfully`);
     } catch (error) {
       console.error('[ESLintFeatureDetector] Failed to initialize HTML ESLint:', error);
     }
 
-    this.initialized = true;
-    console.log(`[ESLintFeatureDetector] Initialization complete`);
+    try {
+      this.computeBaseline = await loadComputeBaseline();
+    } catch (error) {
+      console.error('[ESLintFeatureDetector] Failed to load compute-baseline:', error);
+    }
+
+    debugLog(`[ESLintFeatureDetector] Initialization complete`);
   }
 
   async detectFeatures(context: ParseContext): Promise<IdentifiedFeature[]> {
-    console.log(`[ESLintFeatureDetector.detectFeatures] Starting detection for file: ${context.file_path}`);
-    console.log(`[ESLintFeatureDetector.detectFeatures] File type: ${context.file_type}`);
-    console.log(`[ESLintFeatureDetector.detectFeatures] Content length: ${context.content.length} characters`);
-    console.log(`[ESLintFeatureDetector.detectFeatures] First 200 chars:`, context.content.substring(0, 200));
+    debugLog(`[ESLintFeatureDetector.detectFeatures] Starting detection for file: ${context.file_path}`);
+    debugLog(`[ESLintFeatureDetector.detectFeatures] File type: ${context.file_type}`);
+    debugLog(`[ESLintFeatureDetector.detectFeatures] Content length: ${context.content.length} characters`);
+    debugLog(`[ESLintFeatureDetector.detectFeatures] First 200 chars:`, context.content.substring(0, 200));
     
     await this.initialize();
 
@@ -100,44 +230,44 @@ export class ESLintFeatureDetector {
     
     switch (context.file_type) {
       case 'html':
-        console.log(`[ESLintFeatureDetector.detectFeatures] Routing to HTML detector`);
+        debugLog(`[ESLintFeatureDetector.detectFeatures] Routing to HTML detector`);
         features = await this.detectHTMLFeatures(context);
         break;
 
       case 'css':
       case 'scss':
       case 'sass':
-        console.log(`[ESLintFeatureDetector.detectFeatures] Routing to CSS detector`);
+        debugLog(`[ESLintFeatureDetector.detectFeatures] Routing to CSS detector`);
         features = await this.detectCSSFeatures(context);
         break;
 
       default:
-        console.log(`[ESLintFeatureDetector.detectFeatures] Unsupported file type: ${context.file_type}`);
+        debugLog(`[ESLintFeatureDetector.detectFeatures] Unsupported file type: ${context.file_type}`);
     }
     
-    console.log(`[ESLintFeatureDetector.detectFeatures] Detection complete. Found ${features.length} features`);
+    debugLog(`[ESLintFeatureDetector.detectFeatures] Detection complete. Found ${features.length} features`);
     return features;
   }
 
   private async detectHTMLFeatures(context: ParseContext): Promise<IdentifiedFeature[]> {
     const features: IdentifiedFeature[] = [];
     
-    console.log(`[detectHTMLFeatures] Starting HTML detection for: ${context.file_path}`);
-    console.log(`[detectHTMLFeatures] HTML ESLint available: ${!!this.htmlEslint}`);
+    debugLog(`[detectHTMLFeatures] Starting HTML detection for: ${context.file_path}`);
+    debugLog(`[detectHTMLFeatures] HTML ESLint available: ${!!this.htmlEslint}`);
 
     if (this.htmlEslint) {
       try {
         const virtualPath = 'virtual.html';
-        console.log(`[detectHTMLFeatures] Using virtual path: ${virtualPath} instead of: ${context.file_path}`);
+        debugLog(`[detectHTMLFeatures] Using virtual path: ${virtualPath} instead of: ${context.file_path}`);
         
         const results = await this.htmlEslint.lintText(context.content, {
           filePath: virtualPath
         });
         
-        console.log(`[detectHTMLFeatures] ESLint returned ${results.length} results`);
+        debugLog(`[detectHTMLFeatures] ESLint returned ${results.length} results`);
         
         for (const [i, result] of results.entries()) {
-          console.log(`[detectHTMLFeatures] Result ${i}:`, {
+          debugLog(`[detectHTMLFeatures] Result ${i}:`, {
             filePath: result.filePath,
             messageCount: result.messages.length,
             errorCount: result.errorCount,
@@ -146,7 +276,7 @@ export class ESLintFeatureDetector {
           });
 
           for (const [j, message] of result.messages.entries()) {
-            console.log(`[detectHTMLFeatures] Message ${j}:`, {
+            debugLog(`[detectHTMLFeatures] Message ${j}:`, {
               ruleId: message.ruleId,
               severity: message.severity,
               message: message.message,
@@ -155,12 +285,12 @@ export class ESLintFeatureDetector {
             });
 
             if (message.ruleId === '@html-eslint/use-baseline') {
-              const feature = await this.parseBaselineMessage(message, context, 'html');
+              const feature = this.parseBaselineMessage(message, context, 'html');
               if (feature) {
-                console.log(`[detectHTMLFeatures] Parsed feature:`, feature);
+                debugLog(`[detectHTMLFeatures] Parsed feature:`, feature);
                 features.push(feature);
               } else {
-                console.log(`[detectHTMLFeatures] Failed to parse message: ${message.message}`);
+                debugLog(`[detectHTMLFeatures] Failed to parse message: ${message.message}`);
               }
             }
           }
@@ -173,29 +303,29 @@ export class ESLintFeatureDetector {
       console.warn('[detectHTMLFeatures] HTML ESLint not available');
     }
 
-    console.log(`[detectHTMLFeatures] Returning ${features.length} features`);
+    debugLog(`[detectHTMLFeatures] Returning ${features.length} features`);
     return features;
   }
 
   private async detectCSSFeatures(context: ParseContext): Promise<IdentifiedFeature[]> {
     const features: IdentifiedFeature[] = [];
     
-    console.log(`[detectCSSFeatures] Starting CSS detection for: ${context.file_path}`);
-    console.log(`[detectCSSFeatures] CSS ESLint available: ${!!this.cssEslint}`);
+    debugLog(`[detectCSSFeatures] Starting CSS detection for: ${context.file_path}`);
+    debugLog(`[detectCSSFeatures] CSS ESLint available: ${!!this.cssEslint}`);
 
     if (this.cssEslint) {
       try {
         const virtualPath = 'virtual.css';
-        console.log(`[detectCSSFeatures] Using virtual path: ${virtualPath} instead of: ${context.file_path}`);
+        debugLog(`[detectCSSFeatures] Using virtual path: ${virtualPath} instead of: ${context.file_path}`);
         
         const results = await this.cssEslint.lintText(context.content, {
           filePath: virtualPath
         });
         
-        console.log(`[detectCSSFeatures] ESLint returned ${results.length} results`);
+        debugLog(`[detectCSSFeatures] ESLint returned ${results.length} results`);
         
         for (const [i, result] of results.entries()) {
-          console.log(`[detectCSSFeatures] Result ${i}:`, {
+          debugLog(`[detectCSSFeatures] Result ${i}:`, {
             filePath: result.filePath,
             messageCount: result.messages.length,
             errorCount: result.errorCount,
@@ -204,7 +334,7 @@ export class ESLintFeatureDetector {
           });
 
           for (const [j, message] of result.messages.entries()) {
-            console.log(`[detectCSSFeatures] Message ${j}:`, {
+            debugLog(`[detectCSSFeatures] Message ${j}:`, {
               ruleId: message.ruleId,
               severity: message.severity,
               message: message.message,
@@ -213,12 +343,12 @@ export class ESLintFeatureDetector {
             });
 
             if (message.ruleId === 'css/use-baseline') {
-              const feature = await this.parseBaselineMessage(message, context, 'css');
+              const feature = this.parseBaselineMessage(message, context, 'css');
               if (feature) {
-                console.log(`[detectCSSFeatures] Parsed feature:`, feature);
+                debugLog(`[detectCSSFeatures] Parsed feature:`, feature);
                 features.push(feature);
               } else {
-                console.log(`[detectCSSFeatures] Failed to parse message: ${message.message}`);
+                debugLog(`[detectCSSFeatures] Failed to parse message: ${message.message}`);
               }
             }
           }
@@ -231,75 +361,40 @@ export class ESLintFeatureDetector {
       console.warn('[detectCSSFeatures] CSS ESLint not available');
     }
 
-    console.log(`[detectCSSFeatures] Returning ${features.length} features`);
+    debugLog(`[detectCSSFeatures] Returning ${features.length} features`);
     return features;
   }
 
-  private async parseBaselineMessage(message: any, context: ParseContext, type: 'css' | 'html'): Promise<IdentifiedFeature | null> {
+  private parseBaselineMessage(message: any, context: ParseContext, type: 'css' | 'html'): IdentifiedFeature | null {
     const messageText = message.message;
-    console.log(`[parseBaselineMessage] Parsing message: "${messageText}" for type: ${type}`);
+    debugLog(`[parseBaselineMessage] Parsing message: "${messageText}" for type: ${type}`);
     
-    let syntaxPattern = '';
-    let featureName = '';
-    let bcdKey = '';
-
-    if (type === 'css') {
-      const propertyMatch = messageText.match(/Property '([^']+)'/);
-      const atRuleMatch = messageText.match(/At-rule '@([^']+)'/);
-      const selectorMatch = messageText.match(/Selector '([^']+)'/);
-      const valueMatch = messageText.match(/Value '([^']+)' of property '([^']+)'/);
-      const typeMatch = messageText.match(/Type '([^']+)'/);
-
-      if (propertyMatch && propertyMatch[1]) {
-        syntaxPattern = propertyMatch[1];
-        featureName = `CSS ${syntaxPattern} property`;
-        bcdKey = `css.properties.${syntaxPattern}`;
-      } else if (atRuleMatch && atRuleMatch[1]) {
-        syntaxPattern = `@${atRuleMatch[1]}`;
-        featureName = `CSS @${atRuleMatch[1]} at-rule`;
-        bcdKey = `css.at-rules.${atRuleMatch[1]}`;
-      } else if (selectorMatch && selectorMatch[1]) {
-        syntaxPattern = selectorMatch[1];
-        featureName = `CSS ${syntaxPattern} selector`;
-        bcdKey = `css.selectors.${syntaxPattern}`;
-      } else if (valueMatch && valueMatch[1] && valueMatch[2]) {
-        syntaxPattern = valueMatch[1];
-        featureName = `CSS ${valueMatch[1]} value`;
-        bcdKey = `css.properties.${valueMatch[2]}`;
-      } else if (typeMatch && typeMatch[1]) {
-        syntaxPattern = typeMatch[1];
-        featureName = `CSS ${syntaxPattern} function`;
-        bcdKey = `css.types.${syntaxPattern.replace(/\(\)$/, '')}`;
-      }
-    } else if (type === 'html') {
-      const inputTypeMatch = messageText.match(/Attribute 'type="([^"]+)"' on '<input>'/);
-      const elementMatch = messageText.match(/Element '<([^>]+)>'/);
-      const attributeMatch = messageText.match(/Attribute '([^']+)'/);
-
-      if (inputTypeMatch && inputTypeMatch[1]) {
-        const typeValue = inputTypeMatch[1];
-        syntaxPattern = `type=${typeValue}`;
-        featureName = `HTML type="${typeValue}" attribute`;
-        bcdKey = `html.elements.input.type_${typeValue}`;
-      } else if (elementMatch && elementMatch[1]) {
-        syntaxPattern = elementMatch[1];
-        featureName = `HTML <${syntaxPattern}> element`;
-        bcdKey = `html.elements.${syntaxPattern}`;
-      } else if (attributeMatch && attributeMatch[1]) {
-        syntaxPattern = `${attributeMatch[1]}=`;
-        featureName = `HTML ${attributeMatch[1]} attribute`;
-        bcdKey = `html.global_attributes.${attributeMatch[1]}`;
+    const pattern = type === 'css' ? CSS_MESSAGE_PATTERN : HTML_MESSAGE_PATTERN;
+    const builders = type === 'css' ? CSS_MESSAGE_FEATURES : HTML_MESSAGE_FEATURES;
+    const groups = messageText.match(pattern)?.groups;
+    let parsed: MessageFeature | undefined;
+
+    if (groups) {
+      // Group order follows the pattern, so the first defined group names
+      // the alternative that matched
+      for (const [group, name] of Object.entries<string | undefined>(groups)) {
+        if (name !== undefined) {
+          parsed = builders[group]?.(name, groups);
+          break;
+        }
       }
     }
 
-    if (!syntaxPattern || !featureName) {
+    if (!parsed) {
       console.warn(`[parseBaselineMessage] Could not parse message: no pattern matched`);
       return null;
     }
 
+    const { syntaxPattern, featureName, bcdKey } = parsed;
+
     const feature: IdentifiedFeature = {
       feature_name: featureName,
-      feature_id: `${type}-${syntaxPattern.replace(/[^a-zA-Z0-9]/g, '-').toLowerCase()}`,
+      feature_id: `${type}-${syntaxPattern.replace(FEATURE_ID_UNSAFE_CHARS, '-').toLowerCase()}`,
       bcd_keys: bcdKey ? [bcdKey] : [],
       syntax_pattern: syntaxPattern,
       ast_node_type: type,
@@ -308,32 +403,69 @@ export class ESLintFeatureDetector {
         file: context.file_path,
         line: message.line || 1,
         column: message.column || 1,
-        context: this.getLineContext(context.content, message.line || 1)
+        context: this.getLineContext(context, message.line || 1)
       }
     };
 
     if (bcdKey) {
-      const detailedSupport = await this.enrichWithComputeBaseline(bcdKey);
+      const detailedSupport = this.enrichWithComputeBaseline(bcdKey);
       if (detailedSupport) {
         feature.detailed_support = detailedSupport;
       }
     }
 
-    console.log(`[parseBaselineMessage] Successfully parsed feature:`, feature);
+    debugLog(`[parseBaselineMessage] Successfully parsed feature:`, feature);
     return feature;
   }
 
-  private getLineContext(content: string, lineNumber: number): string {
-    const lines = content.split('\n');
+  /**
+   * Split each file into lines once, however many features it reports
+   */
+  private getLineContext(context: ParseContext, lineNumber: number): string {
+    let lines = this.linesByContext.get(context);
+    if (!lines) {
+      lines = context.content.split('\n');
+      this.linesByContext.set(context, lines);
+    }
+
     const line = lines[lineNumber - 1];
     return line ? line.trim() : '';
   }
 
-  private async enrichWithComputeBaseline(bcdKey: string): Promise<DetailedSupport | undefined> {
+  /**
+   * Baseline data is bundled with compute-baseline, so lookups run
+   * synchronously and results are reused for later lookups of the same key
+   */
+  private enrichWithComputeBaseline(bcdKey: string): DetailedSupport | undefined {
+    if (!this.computeBaseline) {
+      return undefined;
+    }
+
+    if (baselineSupportCache.has(bcdKey)) {
+      const cached = baselineSupportCache.get(bcdKey);
+      baselineSupportCache.delete(bcdKey);
+      baselineSupportCache.set(bcdKey, cached);
+      return cached;
+    }
+
+    const detailedSupport = this.computeDetailedSupport(bcdKey);
+    baselineSupportCache.set(bcdKey, detailedSupport);
+
+    if (baselineSupportCache.size > BASELINE_CACHE_MAX) {
+      const oldestKey = baselineSupportCache.keys().next().value;
+      if (oldestKey !== undefined) {
+        baselineSupportCache.delete(oldestKey);
+      }
+    }
+
+    return detailedSupport;
+  }
+
+  private computeDetailedSupport(bcdKey: string): DetailedSupport | undefined {
     try {
-      console.log(`[enrichWithComputeBaseline] Computing baseline for: ${bcdKey}`);
+      debugLog(`[enrichWithComputeBaseline] Computing baseline for: ${bcdKey}`);
 
-      const result = computeBaseline({
+      const result = this.computeBaseline!({
         compatKeys: [bcdKey],
         checkAncestors: true,
       });
@@ -348,7 +480,7 @@ export class ESLintFeatureDetector {
         discouraged: result.discouraged || false,
       };
 
-      console.log(`[enrichWithComputeBaseline] Enriched data:`, detailedSupport);
+      debugLog(`[enrichWithComputeBaseline] Enriched data:`, detailedSupport);
       return detailedSupport;
 
     } catch (error) {
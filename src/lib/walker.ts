@@ -1,7 +1,82 @@
+import { Dirent, Stats } from 'fs';
 import { readdir, stat, readFile } from 'fs/promises';
-import { join, relative } from 'path';
+import { join, sep } from 'path';
 import { FileType } from '../types/index.js';
 
+export const FILE_TYPES_BY_EXTENSION: Record<string, FileType> = {
+  'css': 'css',
+  'scss': 'scss',
+  'sass': 'sass',
+  'html': 'html',
+  'htm': 'html',
+};
+
+// Skipped by every walk; custom patterns from WalkOptions are added on top
+const DEFAULT_IGNORE_PATTERNS: readonly string[] = [
+  'node_modules',
+  '.git',
+  '.svn',
+  '.hg',
+  'dist',
+  'build',
+  '.next',
+  '.nuxt',
+  'coverage',
+  '.nyc_output',
+  '.cache',
+  'tmp',
+  'temp',
+  '*.min.js',
+  '*.min.css',
+  'vendor',
+];
+
+interface IgnoreRules {
+  names: Set<string>;
+  suffixes: string[];
+  paths: string[];
+}
+
+/**
+ * Sort ignore patterns by how they match, adding to a copy of the base rules
+ */
+function compileIgnorePatterns(patterns: readonly string[], base?: IgnoreRules): IgnoreRules {
+  const rules: IgnoreRules = {
+    names: new Set(base?.names),
+    suffixes: [...(base?.suffixes ?? [])],
+    paths: [...(base?.paths ?? [])],
+  };
+
+  for (const pattern of patterns) {
+    if (pattern.startsWith('*')) {
+      // Glob pattern
+      rules.suffixes.push(pattern.slice(1));
+    } else if (pattern.includes('/')) {
+      rules.paths.push(pattern);
+    } else {
+      rules.names.add(pattern);
+    }
+  }
+
+  return rules;
+}
+
+// Built once; walks without custom patterns use these rules as they are
+const DEFAULT_IGNORE_RULES = compileIgnorePatterns(DEFAULT_IGNORE_PATTERNS);
+
+interface PendingDirectory {
+  path: string;
+  relativePath: string;
+}
+
+interface WalkCandidate {
+  entry: Dirent;
+  fullPath: string;
+  relativePath: string;
+  fileType: FileType | null;
+  stats: Promise<Stats | null> | null;
+}
+
 export interface WalkOptions {
   maxFiles: number;
   supportedExtensions: string[];
@@ -13,113 +88,157 @@ export interface FileInfo {
   relativePath: string;
   fileType: FileType;
   size: number;
+  mtimeMs: number;
 }
 
 /**
  * File system walker with proper async handling and limits
  */
 export class FileWalker {
-  private readonly defaultIgnorePatterns = [
-    'node_modules',
-    '.git',
-    '.svn',
-    '.hg',
-    'dist',
-    'build',
-    '.next',
-    '.nuxt',
-    'coverage',
-    '.nyc_output',
-    '.cache',
-    'tmp',
-    'temp',
-    '*.min.js',
-    '*.min.css',
-    'vendor',
-  ];
-
   async walkDirectory(
     projectPath: string,
     options: WalkOptions
   ): Promise<FileInfo[]> {
     const files: FileInfo[] = [];
-    const ignorePatterns = [...this.defaultIgnorePatterns, ...options.ignorePatterns];
 
-    await this.walkRecursive(
-      projectPath,
-      projectPath,
-      files,
-      options,
-      ignorePatterns
-    );
+    for await (const file of this.walkFiles(projectPath, options)) {
+      files.push(file);
+    }
 
-    return files.slice(0, options.maxFiles);
+    return files;
   }
 
-  private async walkRecursive(
-    currentPath: string,
-    basePath: string,
-    files: FileInfo[],
-    options: WalkOptions,
-    ignorePatterns: string[]
-  ): Promise<void> {
-    if (files.length >= options.maxFiles) {
-      return;
-    }
+  /**
+   * Yield matching files as they are found, so callers can start on them
+   * while the rest of the tree is still being read
+   */
+  async *walkFiles(
+    projectPath: string,
+    options: WalkOptions
+  ): AsyncGenerator<FileInfo> {
+    const ignoreRules = options.ignorePatterns.length > 0
+      ? compileIgnorePatterns(options.ignorePatterns, DEFAULT_IGNORE_RULES)
+      : DEFAULT_IGNORE_RULES;
+    // Relative paths are built up along the walk instead of being
+    // re-derived from the project root for every entry
+    const pendingDirectories: PendingDirectory[] = [{ path: projectPath, relativePath: '' }];
+    let fileCount = 0;
 
-    try {
-      const entries = await readdir(currentPath);
+    while (pendingDirectories.length > 0) {
+      if (fileCount >= options.maxFiles) {
+        break;
+      }
 
-      for (const entry of entries) {
-        if (files.length >= options.maxFiles) {
-          break;
-        }
+      const { path: currentPath, relativePath: currentRelativePath } = pendingDirectories.pop()!;
+      const subdirectories: PendingDirectory[] = [];
 
-        const fullPath = join(currentPath, entry);
-        const relativePath = relative(basePath, fullPath);
+      try {
+        // Dirents carry the entry type, so only matching files need a stat()
+        const entries = await readdir(currentPath, { withFileTypes: true });
+        const remainingFiles = options.maxFiles - fileCount;
+        const candidates: WalkCandidate[] = [];
+        let statedFiles = 0;
 
-        // Check ignore patterns
-        if (this.shouldIgnore(relativePath, entry, ignorePatterns)) {
-          continue;
+        for (const entry of entries) {
+          const fullPath = join(currentPath, entry.name);
+          const relativePath = currentRelativePath
+            ? `${currentRelativePath}${sep}${entry.name}`
+            : entry.name;
+
+          // Check ignore patterns
+          if (this.shouldIgnore(relativePath, entry.name, ignoreRules)) {
+            continue;
+          }
+
+          const fileType = this.isSupportedExtension(entry.name, options.supportedExtensions)
+            ? this.detectFileType(entry.name)
+            : null;
+          let stats: Promise<Stats | null> | null = null;
+
+          // Symlinks are followed, as stat() did before
+          if (entry.isSymbolicLink() || (fileType && entry.isFile() && statedFiles++ < remainingFiles)) {
+            stats = this.statIfPresent(fullPath);
+          }
+
+          candidates.push({ entry, fullPath, relativePath, fileType, stats });
         }
 
-        const stats = await stat(fullPath);
+        // The directory's stat() calls run together instead of one by one
+        const candidateStats = await Promise.all(candidates.map(candidate => candidate.stats));
+
+        for (const [index, candidate] of candidates.entries()) {
+          if (fileCount >= options.maxFiles) {
+            break;
+          }
+
+          const { entry, fullPath, relativePath, fileType } = candidate;
+          const stats = candidateStats[index] ?? null;
+
+          // Broken symlinks and entries removed since readdir() are skipped
+          if (candidate.stats && !stats) {
+            continue;
+          }
+
+          const kind = stats ?? entry;
 
-        if (stats.isDirectory()) {
-          await this.walkRecursive(fullPath, basePath, files, options, ignorePatterns);
-        } else if (stats.isFile()) {
-          const fileType = this.detectFileType(entry);
+          if (kind.isDirectory()) {
+            subdirectories.push({ path: fullPath, relativePath });
+          } else if (kind.isFile() && fileType) {
+            const fileStats = stats ?? await this.statIfPresent(fullPath);
+            if (!fileStats) {
+              continue;
+            }
 
-          if (fileType && this.isSupportedExtension(entry, options.supportedExtensions)) {
-            files.push({
+            fileCount++;
+            yield {
               path: fullPath,
               relativePath,
               fileType,
-              size: stats.size,
-            });
+              size: fileStats.size,
+              mtimeMs: fileStats.mtimeMs,
+            };
           }
         }
+      } catch (error) {
+        console.warn(`Error reading directory ${currentPath}:`, error);
       }
-    } catch (error) {
-      console.warn(`Error reading directory ${currentPath}:`, error);
+
+      // Reversed so subdirectories are popped in listing order
+      pendingDirectories.push(...subdirectories.reverse());
     }
   }
 
-  private shouldIgnore(relativePath: string, filename: string, ignorePatterns: string[]): boolean {
-    for (const pattern of ignorePatterns) {
-      if (pattern.startsWith('*')) {
-        // Glob pattern
-        const extension = pattern.slice(1);
-        if (filename.endsWith(extension)) {
-          return true;
-        }
-      } else {
-        // Directory or file pattern
-        if (relativePath.includes(pattern) || filename === pattern) {
-          return true;
-        }
+  /**
+   * stat() that resolves to null when the entry cannot be stat()ed, so one
+   * vanished file does not fail the rest of its directory
+   */
+  private async statIfPresent(path: string): Promise<Stats | null> {
+    try {
+      return await stat(path);
+    } catch {
+      return null;
+    }
+  }
+
+  // Ignored directories are never entered, so ancestors need no re-check:
+  // only the entry's own name (and any multi-segment patterns) are tested
+  private shouldIgnore(relativePath: string, filename: string, rules: IgnoreRules): boolean {
+    if (rules.names.has(filename)) {
+      return true;
+    }
+
+    for (const suffix of rules.suffixes) {
+      if (filename.endsWith(suffix)) {
+        return true;
+      }
+    }
+
+    for (const pattern of rules.paths) {
+      if (relativePath.includes(pattern)) {
+        return true;
       }
     }
+
     return false;
   }
 
@@ -131,30 +250,14 @@ export class FileWalker {
   private detectFileType(filename: string): FileType | null {
     const extension = filename.split('.').pop()?.toLowerCase();
 
-    const typeMap: Record<string, FileType> = {
-      'css': 'css',
-      'scss': 'scss',
-      'sass': 'sass',
-      'html': 'html',
-      'htm': 'html',
-    };
-
-    return extension ? typeMap[extension] || null : null;
+    return extension ? FILE_TYPES_BY_EXTENSION[extension] || null : null;
   }
 
   /**
    * Read file content with encoding detection
    */
   async readFileContent(filePath: string): Promise<string> {
-    // Avoid attempting to read when we already know it's missing
-    if (!(await this.pathExists(filePath))) {
-      const notFound = new Error(
-        `ENOENT: no such file or directory, open '${filePath}'`
-      ) as NodeJS.ErrnoException;
-      notFound.code = 'ENOENT';
-      notFound.path = filePath as unknown as string;
-      throw notFound;
-    }
+    // A missing file surfaces as readFile's own ENOENT, without a stat() first
     try {
       return await readFile(filePath, 'utf-8');
     } catch (error) {
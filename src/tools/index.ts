@@ -1,104 +1,123 @@
 import { McpError, ErrorCode } from '@modelcontextprotocol/sdk/types.js';
-import { writeFile } from 'fs/promises';
+import { open } from 'fs/promises';
 import chalk from 'chalk';
 import {
   AuditProjectInput,
   AuditFileInput,
   AuditReport,
   FeatureDetection,
+  IdentifiedFeature,
   ParseContext,
   BaselineTarget,
   AuditSummary,
+  DetailedSupport,
   FileType
 } from '../types/index.js';
-import { FileWalker } from '../lib/walker.js';
+import { FileWalker, FileInfo, FILE_TYPES_BY_EXTENSION } from '../lib/walker.js';
 import { ESLintFeatureDetector } from '../lib/eslint-wrapper.js';
+import { DEBUG, debugLog } from '../lib/debug.js';
+
+const SUPPORTED_EXTENSIONS = [
+  '.css', '.scss', '.sass',
+  '.html', '.htm'
+];
+
+// Buffered bytes before the streaming export flushes to disk
+const EXPORT_FLUSH_SIZE = 64 * 1024;
+
+// Files read and linted at the same time during a project audit; always at
+// least one worker, or the audit would finish without scanning anything
+const configuredConcurrency = Number(process.env.AMICOMPAT_MAX_CONCURRENCY);
+const MAX_CONCURRENCY = Number.isFinite(configuredConcurrency) && configuredConcurrency !== 0
+  ? Math.max(1, Math.floor(configuredConcurrency))
+  : 5;
+
+interface CachedDetections {
+  mtimeMs: number;
+  size: number;
+  detections: Promise<FeatureDetection[]>;
+}
+
+// Per-file detections by target and path, reused by later audits while the
+// file's mtime and size are unchanged; least recently used entries go first.
+// Entries are stored while still pending, so concurrent audits of the same
+// file share one read and lint
+const DETECTION_CACHE_MAX = 50_000;
+const detectionCache = new Map<string, CachedDetections>();
 
 /**
  * MCP Tools implementation with full TypeScript support
  */
 export class MCPTools {
   private fileWalker = new FileWalker();
-
-  private readonly supportedExtensions = [
-    '.css', '.scss', '.sass',
-    '.html', '.htm'
-  ];
+  private featureDetectors = new Map<BaselineTarget, ESLintFeatureDetector>();
 
   /**
    * Audit entire project for Baseline compatibility
    */
   async auditProject(input: AuditProjectInput): Promise<{ content: Array<{ type: 'text'; text: string }> }> {
     try {
-      if (!await this.fileWalker.pathExists(input.project_path)) {
-        throw new McpError(ErrorCode.InvalidParams, `Project path does not exist: ${input.project_path}`);
-      }
-
+      // A directory passes with one stat(); only failures need a second one
       if (!await this.fileWalker.isDirectory(input.project_path)) {
+        if (!await this.fileWalker.pathExists(input.project_path)) {
+          throw new McpError(ErrorCode.InvalidParams, `Project path does not exist: ${input.project_path}`);
+        }
+
         throw new McpError(ErrorCode.InvalidParams, `Path is not a directory: ${input.project_path}`);
       }
 
       console.log(chalk.blue(`🔍 Scanning project: ${input.project_path}`));
 
-      // Walk files
-      const files = await this.fileWalker.walkDirectory(input.project_path, {
+      // Walk files, starting detection on each one as soon as it is found
+      const pendingFiles = this.fileWalker.walkFiles(input.project_path, {
         maxFiles: input.max_files,
-        supportedExtensions: this.supportedExtensions,
+        supportedExtensions: SUPPORTED_EXTENSIONS,
         ignorePatterns: [],
       });
 
-      console.log(chalk.green(`📁 Found ${files.length} files to analyze`));
-
-      // Process files and detect features
-      const allFeatureDetections: FeatureDetection[] = [];
+      // Process files and detect features, keeping deduplicated results in file order
+      const detectionsByFile: FeatureDetection[][] = [];
+      let fileCount = 0;
       let processedCount = 0;
 
-      // Create feature detector with target
-      const featureDetector = new ESLintFeatureDetector(input.target);
-
-      for (const file of files) {
-        try {
-          const content = await this.fileWalker.readFileContent(file.path);
-          const context: ParseContext = {
-            file_path: file.path,
-            content,
-            file_type: file.fileType,
-          };
-
-          // Use modern ESLint-based feature detection
-          const identifiedFeatures = await featureDetector.detectFeatures(context);
-
-          for (const feature of identifiedFeatures) {
-            const detection: FeatureDetection = {
-              feature: feature.feature_name,
-              locations: [feature.location]
-            };
-
-            if (feature.detailed_support) {
-              detection.detailed_support = feature.detailed_support;
-            }
+      // Shared detector for this target
+      const featureDetector = this.getFeatureDetector(input.target);
 
-            allFeatureDetections.push(detection);
+      const processNextFiles = async (): Promise<void> => {
+        for (;;) {
+          const next = await pendingFiles.next();
+          if (next.done) {
+            return;
           }
 
-          processedCount++;
-          if (processedCount % 10 === 0) {
-            console.log(chalk.yellow(`⚡ Processed ${processedCount}/${files.length} files`));
+          const file = next.value;
+          const index = fileCount++;
+
+          try {
+            detectionsByFile[index] = await this.detectFileFeatures(featureDetector, input.target, file);
+
+            processedCount++;
+            if (processedCount % 10 === 0) {
+              console.log(chalk.yellow(`⚡ Processed ${processedCount} files`));
+            }
+          } catch (error) {
+            console.warn(chalk.red(`❌ Failed to process ${file.path}:`), error);
           }
-        } catch (error) {
-          console.warn(chalk.red(`❌ Failed to process ${file.path}:`), error);
         }
-      }
+      };
+
+      await Promise.all(Array.from({ length: MAX_CONCURRENCY }, processNextFiles));
 
-      // Deduplicate feature detections by {file, line, feature} key
-      const deduplicatedDetections = this.deduplicateFeatureDetections(allFeatureDetections);
+      console.log(chalk.green(`📁 Analyzed ${fileCount} files`));
+
+      const deduplicatedDetections = detectionsByFile.flat();
 
       // Generate report with deduplicated detections
       const report = await this.generateReport(
         input.project_path,
         input.target,
         deduplicatedDetections,
-        files.length
+        fileCount
       );
 
 
@@ -136,16 +155,23 @@ export class MCPTools {
    */
   async auditFile(input: AuditFileInput): Promise<{ content: Array<{ type: 'text'; text: string }> }> {
     try {
-      if (!await this.fileWalker.pathExists(input.file_path)) {
-        throw new McpError(ErrorCode.InvalidParams, `File does not exist: ${input.file_path}`);
-      }
-
       const fileType = this.detectFileType(input.file_path);
       if (!fileType) {
         throw new McpError(ErrorCode.InvalidParams, `Unsupported file type: ${input.file_path}`);
       }
 
-      const content = await this.fileWalker.readFileContent(input.file_path);
+      // Read directly; a missing file is reported from the read error
+      let content: string;
+      try {
+        content = await this.fileWalker.readFileContent(input.file_path);
+      } catch (error) {
+        const code = (error as NodeJS.ErrnoException).code;
+        if (code === 'ENOENT' || code === 'ENOTDIR') {
+          throw new McpError(ErrorCode.InvalidParams, `File does not exist: ${input.file_path}`);
+        }
+        throw error;
+      }
+
       const context: ParseContext = {
         file_path: input.file_path,
         content,
@@ -153,7 +179,7 @@ export class MCPTools {
       };
 
       // Use modern ESLint-based feature detection
-      const featureDetector = new ESLintFeatureDetector();
+      const featureDetector = this.getFeatureDetector();
       const identifiedFeatures = await featureDetector.detectFeatures(context);
 
       if (identifiedFeatures.length === 0) {
@@ -185,6 +211,19 @@ export class MCPTools {
 
   // Helper methods
 
+  /**
+   * Detectors are reused across calls so their linters are only built once
+   * per target
+   */
+  private getFeatureDetector(target: BaselineTarget = 'widely'): ESLintFeatureDetector {
+    let detector = this.featureDetectors.get(target);
+    if (!detector) {
+      detector = new ESLintFeatureDetector(target);
+      this.featureDetectors.set(target, detector);
+    }
+    return detector;
+  }
+
   /**
    * Safe JSON stringify that handles circular references
    */
@@ -227,57 +266,38 @@ export class MCPTools {
     const { summary } = report;
 
     // Debug: Check if detailed_support data is present
-    const featuresWithSupport = report.features_detected.filter(f => f.detailed_support);
-    console.log(`[formatAuditSummary] Total features: ${report.features_detected.length}, With detailed_support: ${featuresWithSupport.length}`);
+    if (DEBUG) {
+      let featuresWithSupport = 0;
+      for (const feature of report.features_detected) {
+        if (feature.detailed_support) {
+          featuresWithSupport++;
+        }
+      }
+      debugLog(`[formatAuditSummary] Total features: ${report.features_detected.length}, With detailed_support: ${featuresWithSupport}`);
+    }
 
     // Use plain text for MCP compatibility (no chalk colors)
-    let output = '🎯 Baseline Compatibility Report [v2.0-fixed]\n\n';
+    let output = `🎯 Baseline Compatibility Report [v2.0-fixed]
+
+📊 Summary:
+   Target: ${report.target}
+   Features Detected: ${summary.total_features}
+   Baseline Violations: ${summary.baseline_violations}
+   Files Scanned: ${summary.files_scanned}
 
-    output += '📊 Summary:\n';
-    output += `   Target: ${report.target}\n`;
-    output += `   Features Detected: ${summary.total_features}\n`;
-    output += `   Baseline Violations: ${summary.baseline_violations}\n`;
-    output += `   Files Scanned: ${summary.files_scanned}\n\n`;
+`;
 
     if (summary.total_features > 0) {
       output += '🔍 Detailed Compatibility Analysis:\n';
       report.features_detected.slice(0, 10).forEach((feature, index) => {
-        output += `   ${index + 1}. ${feature.feature} (${feature.locations.length} location${feature.locations.length > 1 ? 's' : ''})\n`;
-
-        // Add browser compatibility info if available
-        if (feature.detailed_support) {
-          const support = feature.detailed_support;
+        const locationCount = feature.locations.length;
+        output += `   ${index + 1}. ${feature.feature} (${locationCount} location${locationCount > 1 ? 's' : ''})\n`;
 
-          const browsers = Object.entries(support.browser_support)
-            .map(([browser, version]) => `${browser} ${version}+`)
-            .join(', ');
+        // Add browser compatibility info if available, then locations
+        output += this.formatSupport(feature.detailed_support);
 
-          output += `      📈 Browser Support: ${browsers}\n`;
-
-          if (support.baseline_status === 'high') {
-            output += `      ✅ Baseline: High (widely supported)`;
-          } else if (support.baseline_status === 'low') {
-            output += `      🟡 Baseline: Low (limited support)`;
-          } else {
-            output += `      ❌ Baseline: Not supported`;
-          }
-
-          if (support.baseline_low_date) {
-            output += ` - Available since ${support.baseline_low_date}`;
-          }
-          output += `\n`;
-
-          // Show locations
-          feature.locations.forEach(loc => {
-            output += `      📍 ${loc.file}:${loc.line}:${loc.column}\n`;
-            output += `         ${loc.context}\n`;
-          });
-        } else {
-          output += `      ⚠️  No compatibility data available\n`;
-          feature.locations.forEach(loc => {
-            output += `      📍 ${loc.file}:${loc.line}:${loc.column}\n`;
-            output += `         ${loc.context}\n`;
-          });
+        for (const loc of feature.locations) {
+          output += `      📍 ${loc.file}:${loc.line}:${loc.column}\n         ${loc.context}\n`;
         }
         output += `\n`;
       });
@@ -302,29 +322,7 @@ export class MCPTools {
         output += `      ${feature.location.context}\n`;
 
         // Add browser compatibility info if available
-        if (feature.detailed_support) {
-          const support = feature.detailed_support;
-          const browsers = Object.entries(support.browser_support)
-            .map(([browser, version]) => `${browser} ${version}+`)
-            .join(', ');
-
-          output += `      📈 Browser Support: ${browsers}\n`;
-
-          if (support.baseline_status === 'high') {
-            output += `      ✅ Baseline: High (widely supported)`;
-          } else if (support.baseline_status === 'low') {
-            output += `      🟡 Baseline: Low (limited support)`;
-          } else {
-            output += `      ❌ Baseline: Not supported`;
-          }
-
-          if (support.baseline_low_date) {
-            output += ` - Available since ${support.baseline_low_date}`;
-          }
-          output += `\n`;
-        } else {
-          output += `      ⚠️  No compatibility data available\n`;
-        }
+        output += this.formatSupport(feature.detailed_support);
         output += `\n`;
       });
     }
@@ -333,40 +331,126 @@ export class MCPTools {
   }
 
   /**
-   * Deduplicate feature detections by file, line, and feature combination
+   * Detect and deduplicate one file's features, skipping the read and lint
+   * when an earlier or concurrent audit saw the same file unchanged
    */
-  private deduplicateFeatureDetections(detections: FeatureDetection[]): FeatureDetection[] {
+  private async detectFileFeatures(
+    featureDetector: ESLintFeatureDetector,
+    target: BaselineTarget,
+    file: FileInfo
+  ): Promise<FeatureDetection[]> {
+    const cacheKey = `${target}:${file.path}`;
+    const cached = detectionCache.get(cacheKey);
+    detectionCache.delete(cacheKey);
+
+    if (cached && cached.mtimeMs === file.mtimeMs && cached.size === file.size) {
+      detectionCache.set(cacheKey, cached);
+      return cached.detections;
+    }
+
+    const entry: CachedDetections = {
+      mtimeMs: file.mtimeMs,
+      size: file.size,
+      detections: this.lintFile(featureDetector, file),
+    };
+
+    detectionCache.set(cacheKey, entry);
+    if (detectionCache.size > DETECTION_CACHE_MAX) {
+      const oldestKey = detectionCache.keys().next().value;
+      if (oldestKey !== undefined) {
+        detectionCache.delete(oldestKey);
+      }
+    }
+
+    try {
+      return await entry.detections;
+    } catch (error) {
+      // Failures are not cached; the next audit retries the file
+      if (detectionCache.get(cacheKey) === entry) {
+        detectionCache.delete(cacheKey);
+      }
+      throw error;
+    }
+  }
+
+  private async lintFile(
+    featureDetector: ESLintFeatureDetector,
+    file: FileInfo
+  ): Promise<FeatureDetection[]> {
+    const content = await this.fileWalker.readFileContent(file.path);
+    const context: ParseContext = {
+      file_path: file.path,
+      content,
+      file_type: file.fileType,
+    };
+
+    // Use modern ESLint-based feature detection
+    const identifiedFeatures = await featureDetector.detectFeatures(context);
+    return this.collectFeatureDetections(identifiedFeatures);
+  }
+
+  /**
+   * Browser support and Baseline status lines shared by both reports
+   */
+  private formatSupport(support: DetailedSupport | undefined): string {
+    if (!support) {
+      return `      ⚠️  No compatibility data available\n`;
+    }
+
+    const browsers = Object.entries(support.browser_support)
+      .map(([browser, version]) => `${browser} ${version}+`)
+      .join(', ');
+
+    let status: string;
+    if (support.baseline_status === 'high') {
+      status = '✅ Baseline: High (widely supported)';
+    } else if (support.baseline_status === 'low') {
+      status = '🟡 Baseline: Low (limited support)';
+    } else {
+      status = '❌ Baseline: Not supported';
+    }
+
+    const since = support.baseline_low_date ? ` - Available since ${support.baseline_low_date}` : '';
+
+    return `      📈 Browser Support: ${browsers}\n      ${status}${since}\n`;
+  }
+
+  /**
+   * Deduplicate one file's features by file, line, and feature combination.
+   * Keys never span files, so grouping per file as results arrive matches
+   * deduplicating the whole project afterwards
+   */
+  private collectFeatureDetections(features: IdentifiedFeature[]): FeatureDetection[] {
     const uniqueDetections = new Map<string, FeatureDetection>();
 
-    for (const detection of detections) {
-      for (const location of detection.locations) {
-        const key = `${location.file}:${location.line}:${detection.feature}`;
+    for (const feature of features) {
+      const location = feature.location;
+      const key = `${location.file}:${location.line}:${feature.feature_name}`;
+      const existing = uniqueDetections.get(key);
 
-        if (!uniqueDetections.has(key)) {
-          const newDetection: FeatureDetection = {
-            feature: detection.feature,
-            locations: [location]
-          };
+      if (!existing) {
+        const newDetection: FeatureDetection = {
+          feature: feature.feature_name,
+          locations: [location]
+        };
 
-          if (detection.detailed_support) {
-            newDetection.detailed_support = detection.detailed_support;
-          }
+        if (feature.detailed_support) {
+          newDetection.detailed_support = feature.detailed_support;
+        }
 
-          uniqueDetections.set(key, newDetection);
-        } else {
-          // Merge locations if the same feature is detected multiple times
-          const existing = uniqueDetections.get(key)!;
-          if (!existing.locations.some(loc =>
-            loc.file === location.file &&
-            loc.line === location.line &&
-            loc.column === location.column
-          )) {
-            existing.locations.push(location);
-          }
-          // Preserve detailed_support if not already set
-          if (!existing.detailed_support && detection.detailed_support) {
-            existing.detailed_support = detection.detailed_support;
-          }
+        uniqueDetections.set(key, newDetection);
+      } else {
+        // Merge locations if the same feature is detected multiple times
+        if (!existing.locations.some(loc =>
+          loc.file === location.file &&
+          loc.line === location.line &&
+          loc.column === location.column
+        )) {
+          existing.locations.push(location);
+        }
+        // Preserve detailed_support if not already set
+        if (!existing.detailed_support && feature.detailed_support) {
+          existing.detailed_support = feature.detailed_support;
         }
       }
     }
@@ -374,25 +458,64 @@ export class MCPTools {
     return Array.from(uniqueDetections.values());
   }
 
+  /**
+   * Stream the report to disk one feature at a time, producing the same
+   * output as JSON.stringify(report, null, 2) without holding it in memory
+   */
   private async exportReport(report: AuditReport, exportPath: string): Promise<void> {
-    await writeFile(exportPath, JSON.stringify(report, null, 2), 'utf-8');
+    const handle = await open(exportPath, 'w');
+
+    try {
+      let buffer = '{';
+      let separator = '\n  ';
+
+      for (const [key, value] of Object.entries(report)) {
+        if (value === undefined) {
+          continue;
+        }
+
+        buffer += `${separator}${JSON.stringify(key)}: `;
+        separator = ',\n  ';
+
+        if (key !== 'features_detected') {
+          buffer += this.indentJson(value, 2);
+          continue;
+        }
+
+        buffer += '[';
+        for (const [index, feature] of report.features_detected.entries()) {
+          buffer += (index === 0 ? '\n    ' : ',\n    ') + this.indentJson(feature, 4);
+
+          if (buffer.length >= EXPORT_FLUSH_SIZE) {
+            await handle.write(buffer, null, 'utf-8');
+            buffer = '';
+          }
+        }
+        buffer += report.features_detected.length > 0 ? '\n  ]' : ']';
+      }
+
+      buffer += '\n}';
+      await handle.write(buffer, null, 'utf-8');
+    } finally {
+      await handle.close();
+    }
+
     console.log(chalk.green(`📊 Report exported to ${exportPath}`));
   }
 
+  /**
+   * Pretty-print a value nested at the given indentation depth
+   */
+  private indentJson(value: unknown, depth: number): string {
+    return JSON.stringify(value, null, 2).replaceAll('\n', `\n${' '.repeat(depth)}`);
+  }
+
   /**
    * Detect file type from extension
    */
   private detectFileType(filePath: string): FileType | null {
     const extension = filePath.split('.').pop()?.toLowerCase();
 
-    const typeMap: Record<string, FileType> = {
-      'css': 'css',
-      'scss': 'scss',
-      'sass': 'sass',
-      'html': 'html',
-      'htm': 'html',
-    };
-
-    return extension ? typeMap[extension] || null : null;
+    return extension ? FILE_TYPES_BY_EXTENSION[extension] || null : null;
   }
 }
\ No newline at end of file
@@ -1,6 +1,8 @@
-import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 import { MCPTools } from '../../src/tools/index.js';
-import { writeFile, mkdir, rm } from 'fs/promises';
+import { ESLintFeatureDetector } from '../../src/lib/eslint-wrapper.js';
+import { FileWalker } from '../../src/lib/walker.js';
+import { writeFile, readFile, mkdir, rm } from 'fs/promises';
 import { join } from 'path';
 
 describe('MCP Tools Integration Tests', () => {
@@ -60,6 +62,8 @@ describe('MCP Tools Integration Tests', () => {
   });
 
   afterEach(async () => {
+    vi.restoreAllMocks();
+
     try {
       await rm(testDir, { recursive: true, force: true });
     } catch {
@@ -197,6 +201,117 @@ describe('MCP Tools Integration Tests', () => {
       expect(result.content[0].text).toContain('Report exported to');
     });
 
+    it('should export a valid JSON report', async () => {
+      const exportPath = join(testDir, 'report.json');
+      const input = {
+        project_path: testDir,
+        target: 'widely' as const,
+        max_files: 100,
+        export_path: exportPath
+      };
+
+      await tools.auditProject(input);
+
+      const text = await readFile(exportPath, 'utf-8');
+      const report = JSON.parse(text);
+      expect(text).toBe(JSON.stringify(report, null, 2));
+      expect(report.project_path).toBe(testDir);
+      expect(report.target).toBe('widely');
+      expect(Array.isArray(report.features_detected)).toBe(true);
+      expect(report.features_detected).toHaveLength(report.summary.total_features);
+      expect(report.summary.files_scanned).toBe(2);
+    });
+
+    it('should export a valid JSON report with no features', async () => {
+      const projectDir = join(testDir, 'plain');
+      const exportPath = join(testDir, 'plain-report.json');
+      await mkdir(projectDir, { recursive: true });
+      await writeFile(join(projectDir, 'styles.css'), '.basic { color: red; }');
+
+      await tools.auditProject({
+        project_path: projectDir,
+        target: 'widely' as const,
+        max_files: 100,
+        export_path: exportPath
+      });
+
+      const text = await readFile(exportPath, 'utf-8');
+      const report = JSON.parse(text);
+      expect(text).toBe(JSON.stringify(report, null, 2));
+      expect(report.features_detected).toEqual([]);
+      expect(report.summary.files_scanned).toBe(1);
+    });
+
+    it('should pick up file changes between audits', async () => {
+      const projectDir = join(testDir, 'changing');
+      const cssFile = join(projectDir, 'styles.css');
+      await mkdir(projectDir, { recursive: true });
+      await writeFile(cssFile, '.basic { color: red; }');
+
+      const input = {
+        project_path: projectDir,
+        target: 'widely' as const,
+        max_files: 100
+      };
+
+      const before = await tools.auditProject(input);
+      expect(before.content[0].text).toContain('Features Detected: 0');
+
+      await writeFile(cssFile, '.slide { view-transition-name: slide-in; }');
+
+      const after = await tools.auditProject(input);
+      expect(after.content[0].text).toContain('Features Detected: 1');
+    });
+
+    it('should reuse detections for unchanged files', async () => {
+      const projectDir = join(testDir, 'unchanged');
+      await mkdir(projectDir, { recursive: true });
+      await writeFile(join(projectDir, 'styles.css'), '.slide { view-transition-name: slide-in; }');
+      await writeFile(join(projectDir, 'page.html'), '<dialog>Hello</dialog>');
+
+      const input = {
+        project_path: projectDir,
+        target: 'widely' as const,
+        max_files: 100
+      };
+
+      const before = await tools.auditProject(input);
+
+      const detectSpy = vi.spyOn(ESLintFeatureDetector.prototype, 'detectFeatures');
+      const readSpy = vi.spyOn(FileWalker.prototype, 'readFileContent');
+
+      const after = await tools.auditProject(input);
+
+      expect(detectSpy).not.toHaveBeenCalled();
+      expect(readSpy).not.toHaveBeenCalled();
+      expect(after.content[0].text).toBe(before.content[0].text);
+    });
+
+    it('should lint each file once across concurrent audits', async () => {
+      const projectDir = join(testDir, 'concurrent');
+      await mkdir(projectDir, { recursive: true });
+      await writeFile(join(projectDir, 'styles.css'), '.slide { view-transition-name: slide-in; }');
+      await writeFile(join(projectDir, 'page.html'), '<dialog>Hello</dialog>');
+
+      const detectSpy = vi.spyOn(ESLintFeatureDetector.prototype, 'detectFeatures');
+      const readSpy = vi.spyOn(FileWalker.prototype, 'readFileContent');
+
+      const input = {
+        project_path: projectDir,
+        target: 'widely' as const,
+        max_files: 100
+      };
+
+      const [first, second] = await Promise.all([
+        tools.auditProject(input),
+        tools.auditProject(input)
+      ]);
+
+      expect(detectSpy).toHaveBeenCalledTimes(2);
+      expect(readSpy).toHaveBeenCalledTimes(2);
+      expect(second.content[0].text).toBe(first.content[0].text);
+    });
+
     it('should handle non-existent project', async () => {
       const input = {
         project_path: '/non/existent/path'
@@ -134,6 +134,22 @@ describe('ESLintFeatureDetector', () => {
     });
   });
 
+  describe('Baseline enrichment', () => {
+    it('should reuse computed support data for repeated features', async () => {
+      const context: ParseContext = {
+        file_path: 'test.css',
+        content: '.slide { view-transition-name: slide-in; }',
+        file_type: 'css'
+      };
+
+      const first = await detector.detectFeatures(context);
+      const second = await new ESLintFeatureDetector('widely').detectFeatures(context);
+
+      expect(first[0].detailed_support).toBeDefined();
+      expect(second[0].detailed_support).toBe(first[0].detailed_support);
+    });
+  });
+
   describe('Unsupported file types', () => {
     it('should return empty array for unsupported file types', async () => {
       const context: ParseContext = {
@@ -1,6 +1,6 @@
 import { describe, it, expect, beforeEach, afterEach } from 'vitest';
 import { FileWalker } from '../../src/lib/walker.js';
-import { writeFile, mkdir, rm } from 'fs/promises';
+import { writeFile, mkdir, rm, symlink } from 'fs/promises';
 import { join } from 'path';
 
 describe('FileWalker', () => {
@@ -118,6 +118,114 @@ describe('FileWalker', () => {
       const filenames = files.map(f => f.relativePath);
       expect(filenames.some(f => f.endsWith('.scss'))).toBe(false);
     });
+
+    it('should report paths relative to the project root', async () => {
+      await mkdir(join(testDir, 'src/components'), { recursive: true });
+      await writeFile(join(testDir, 'src/components/button.css'), '.button { color: red; }');
+
+      const options = {
+        maxFiles: 100,
+        supportedExtensions: ['.css'],
+        ignorePatterns: []
+      };
+
+      const files = await walker.walkDirectory(testDir, options);
+
+      const button = files.find(f => f.path.endsWith('button.css'));
+      expect(button?.relativePath).toBe(join('src', 'components', 'button.css'));
+      expect(button?.path).toBe(join(testDir, 'src', 'components', 'button.css'));
+    });
+
+    it('should only ignore exact directory names', async () => {
+      await mkdir(join(testDir, 'src/templates'), { recursive: true });
+      await writeFile(join(testDir, 'src/templates/card.css'), '.card { color: red; }');
+
+      const options = {
+        maxFiles: 100,
+        supportedExtensions: ['.css'],
+        ignorePatterns: []
+      };
+
+      const files = await walker.walkDirectory(testDir, options);
+
+      const filenames = files.map(f => f.relativePath);
+      expect(filenames.some(f => f.includes('card.css'))).toBe(true);
+    });
+  });
+
+  describe('walkFiles', () => {
+    it('should yield parent files before subdirectory files', async () => {
+      // Own directory, so files shipped in test-project do not affect the walk
+      const walkDir = join(testDir, 'walk-order');
+      await mkdir(join(walkDir, 'src/components'), { recursive: true });
+      await writeFile(join(walkDir, 'root.css'), '.root { color: red; }');
+      await writeFile(join(walkDir, 'src/styles.css'), '.test { color: red; }');
+      await writeFile(join(walkDir, 'src/main.scss'), '.btn { color: blue; }');
+      await writeFile(join(walkDir, 'src/page.html'), '<search></search>');
+      await writeFile(join(walkDir, 'src/index.html'), '<dialog></dialog>');
+      await writeFile(join(walkDir, 'src/components/button.css'), '.button { color: red; }');
+
+      const options = {
+        maxFiles: 100,
+        supportedExtensions: ['.css', '.scss', '.sass', '.html'],
+        ignorePatterns: []
+      };
+
+      const yielded: string[] = [];
+      for await (const file of walker.walkFiles(walkDir, options)) {
+        yielded.push(file.relativePath);
+      }
+
+      // Order within one directory follows the filesystem's listing
+      expect(yielded).toHaveLength(6);
+      expect(yielded[0]).toBe('root.css');
+      expect(yielded.slice(1, 5).sort()).toEqual([
+        join('src', 'index.html'),
+        join('src', 'main.scss'),
+        join('src', 'page.html'),
+        join('src', 'styles.css'),
+      ]);
+      expect(yielded[5]).toBe(join('src', 'components', 'button.css'));
+    });
+
+    it('should skip a broken symlink without dropping its directory', async () => {
+      const walkDir = join(testDir, 'broken-link');
+      await mkdir(join(walkDir, 'nested'), { recursive: true });
+      await symlink(join(walkDir, 'missing.css'), join(walkDir, 'dangling.css'));
+      await writeFile(join(walkDir, 'sibling.css'), '.sibling { color: red; }');
+      await writeFile(join(walkDir, 'nested/child.css'), '.child { color: red; }');
+
+      const options = {
+        maxFiles: 100,
+        supportedExtensions: ['.css'],
+        ignorePatterns: []
+      };
+
+      const yielded: string[] = [];
+      for await (const file of walker.walkFiles(walkDir, options)) {
+        yielded.push(file.relativePath);
+      }
+
+      expect(yielded.sort()).toEqual([
+        join('nested', 'child.css'),
+        'sibling.css',
+      ]);
+    });
+
+    it('should stop after maxFiles files', async () => {
+      const options = {
+        maxFiles: 1,
+        supportedExtensions: ['.css', '.scss', '.sass', '.html'],
+        ignorePatterns: []
+      };
+
+      const yielded = [];
+      for await (const file of walker.walkFiles(testDir, options)) {
+        yielded.push(file);
+      }
+
+      expect(yielded).toHaveLength(1);
+    });
   });
 
   describe('readFileContent', () => {